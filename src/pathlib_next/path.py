@@ -38,7 +38,7 @@ class _PathnameParents(_ty.Sequence[PN]):
     """This object provides sequence-like access to the logical ancestors
     of a path.  Don't try to construct it yourself."""
 
-    __slots__ = ("_path", "_segments")
+    __slots__ = ("_path", "_segments", "_cached")
 
     def __init__(self, path: PN):
         self._path = path
@@ -46,6 +46,7 @@ class _PathnameParents(_ty.Sequence[PN]):
         while segments and not segments[-1]:
             segments = segments[:-1]
         self._segments = segments
+        self._cached: "list[PN | None]" = [None] * len(segments)
 
     def __len__(self):
         return len(self._segments)
@@ -62,7 +63,26 @@ class _PathnameParents(_ty.Sequence[PN]):
             raise IndexError(idx)
         if idx < 0:
             idx += len(self)
-        return self._path.with_segments(*self._segments[: -idx - 1])
+        parent = self._cached[idx]
+        if parent is None:
+            parent = self._path.with_segments(*self._segments[: -idx - 1])
+            self._cached[idx] = parent
+        return parent
+
+    def __contains__(self, path: object):
+        if not isinstance(path, Pathname):
+            return any(parent == path for parent in self)
+        segments = path.segments
+        if "" in segments[1:] or "" in self._segments[1:]:
+            # Ancestors ending in an empty segment do not line up with the prefixes
+            return any(parent == path for parent in self)
+        # Only the ancestor with the same leading segments can be equal
+        depth = len(segments)
+        if depth >= len(self._segments) or any(
+            a != b for a, b in zip(segments, self._segments)
+        ):
+            return False
+        return self[len(self._segments) - depth - 1] == path
 
     def __repr__(self):
         return "<{}.parents>".format(type(self._path).__name__)
@@ -250,6 +270,13 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
         """
         ...
 
+    def _is_dir_hint(self) -> bool | None:
+        """
+        Whether this path is a directory if already known without any I/O
+        (e.g. from the listing that produced it), following symlinks or not
+        """
+        return None
+
     def glob(
         self,
         pattern: str | _ty.Self,
@@ -293,16 +320,22 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
 
             dirnames: "list[str]" = []
             filenames: "list[str]" = []
+            # Keep the entries so anything iterdir prefetched on them is reused
+            dirs: "dict[str, _ty.Self]" = {}
             for entry in scandir_it:
-                try:
-                    stat = FileStat.from_path(entry, follow_symlink=follow_symlinks)
-                    is_dir = stat.is_dir()
-                except OSError:
-                    # Carried over from os.path.isdir().
-                    is_dir = False
+                is_dir = entry._is_dir_hint()
+                if is_dir is None:
+                    try:
+                        stat = FileStat.from_path(entry, follow_symlink=follow_symlinks)
+                        is_dir = stat is not None and stat.is_dir()
+                    except OSError:
+                        # Carried over from os.path.isdir().
+                        is_dir = False
 
                 if is_dir:
-                    dirnames.append(entry.name)
+                    name = entry.name or entry.parent.name
+                    dirnames.append(name)
+                    dirs[name] = entry
                 else:
                     filenames.append(entry.name)
 
@@ -311,7 +344,7 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
             else:
                 paths.append((path, dirnames, filenames))
 
-            paths += [path / d for d in reversed(dirnames)]
+            paths += [dirs[d] if d in dirs else path / d for d in reversed(dirnames)]
 
     def touch(self, mode=0o666, exist_ok=True):
         """
@@ -389,7 +422,18 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
     @_utils.notimplemented
     def rename(self, target: "_ty.Self | str"): ...
 
-    def copy(self, target: "Path | str", *, overwrite=False):
+    def _copy_to(self, target: "Path", *, hash_algo=None) -> str | None:
+        """
+        Copy the content of this file into target,
+        implementations can override it with a faster transfer
+        """
+        return BinaryOpen.copy(self, target, hash_algo=hash_algo)
+
+    def copy(self, target: "Path | str", *, overwrite=False, hash_algo=None):
+        """
+        Copy this file to target, if hash_algo is given the content is hashed
+        during the transfer and its hexdigest returned.
+        """
         if isinstance(target, str):
             target = type(self)(target)
         src = self
@@ -401,13 +445,14 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
                 target.unlink()
             else:
                 raise FileExistsError(target)
-        BinaryOpen.copy(src, target)
+        digest = src._copy_to(target, hash_algo=hash_algo)
 
         try:
             stat = src.stat()
             target.chmod(stat.st_mode)
         except NotImplementedError:
             pass
+        return digest
 
     def move(self, target: "Path|str", *, overwrite=False):
         if isinstance(target, str):
@@ -427,7 +472,7 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
         except NotImplementedError:
             pass
 
-        BinaryOpen.copy(src, target)
+        src._copy_to(target)
         src.unlink()
 
 
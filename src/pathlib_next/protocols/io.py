@@ -75,6 +75,17 @@ class BinaryOpen(_ty.Protocol):
         ) as f:
             return f.write(data)
 
-    def copy(self, target: "BinaryOpen"):
+    def copy(self, target: "BinaryOpen", *, hash_algo=None) -> str | None:
+        """
+        Copy the content into target, if hash_algo is given the data is hashed
+        while it is copied and the hexdigest is returned.
+        """
         with target.open("wb") as output, self.open("rb") as input:
-            _shutil.copyfileobj(input, output)
+            if hash_algo is None:
+                _shutil.copyfileobj(input, output)
+                return None
+            hasher = _utils.hasher(hash_algo)
+            while buf := input.read(_shutil.COPY_BUFSIZE):
+                hasher.update(buf)
+                output.write(buf)
+        return hasher.hexdigest()
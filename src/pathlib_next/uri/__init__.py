@@ -1,3 +1,4 @@
+import functools as _func
 import os
 import pathlib as _pathlib
 import posixpath as _posix
@@ -16,6 +17,8 @@ from .source import Source
 UriLike: _ty.TypeAlias = "str | Uri | os.PathLike"
 
 _NOSOURCE = Source(None, None, None, None)
+# Characters uritools.uricompose leaves unencoded in paths
+_SAFE_PATH = "!$&'()*+,;=:@/"
 
 _U = _ty.TypeVar("_U", bound="Uri")
 
@@ -24,6 +27,84 @@ def _uriencode(text: str, safe=""):
     return uritools.uriencode(text, safe=safe).decode()
 
 
+@_func.lru_cache(maxsize=4096)
+def _parse_uri(uri: str) -> "tuple[Source, str, Query, str]":
+    parsed = uritools.urisplit(uri)
+    return (
+        Source(
+            parsed.getscheme(),
+            parsed.getuserinfo(),
+            parsed.gethost() or "",
+            parsed.getport(),
+        ),
+        parsed.getpath(),
+        Query(parsed.getquery() or ""),
+        parsed.getfragment() or "",
+    )
+
+
+@_func.lru_cache(maxsize=1024)
+def _format_source(source: Source, sanitize: bool) -> str:
+    return _compose_parsed_parts(source, "", "", "", sanitize)
+
+
+@_func.lru_cache(maxsize=1024)
+def _format_query_fragment(query: str, fragment: str) -> str:
+    return _compose_parsed_parts(_NOSOURCE, "", query, fragment, False)
+
+
+@_func.lru_cache(maxsize=4096)
+def _format_parsed_parts(
+    source: Source, path: str, query: str, fragment: str, sanitize: bool
+) -> str:
+    # Paths that uricompose does not rewrite or reject only need encoding,
+    # so reuse the formatted source and query/fragment shared by sibling uris
+    if not path or (path[0] == "/" and path[1:2] != "/"):
+        return "".join(
+            (
+                _format_source(source, sanitize),
+                _uriencode(path, _SAFE_PATH),
+                _format_query_fragment(query, fragment),
+            )
+        )
+    return _compose_parsed_parts(source, path, query, fragment, sanitize)
+
+
+def _compose_parsed_parts(
+    source: Source, path: str, query: str, fragment: str, sanitize: bool
+) -> str:
+    parts = {
+        "path": path,
+    }
+    if query:
+        parts["query"] = query
+    if fragment:
+        parts["fragment"] = fragment
+    if source:
+        source_ = source._asdict()
+        if sanitize:
+            source_["userinfo"] = (source_["userinfo"] or "").split(":", maxsplit=1)[0]
+        parts.update(source_)
+
+    return uritools.uricompose(**{k: v for k, v in parts.items() if v})
+
+
+def _all_slots(cls: type) -> tuple[str, ...]:
+    slots: dict[str, None] = {}
+    for _cls in reversed(cls.__mro__):
+        _slots = getattr(_cls, "__slots__", ())
+        slots.update(dict.fromkeys((_slots,) if isinstance(_slots, str) else _slots))
+    return tuple(slots)
+
+
+def _make_preinit(slots: tuple[str, ...]):
+    """Straight-line function setting every slot to None, faster than a loop of setattr"""
+    lines = [f"    self.{slot} = None" for slot in slots] or ["    pass"]
+    namespace = {}
+    exec("def _preinit(self):\n" + "\n".join(lines), namespace)
+    return namespace["_preinit"]
+
+
 class Uri(Pathname):
 
     __slots__ = (
@@ -37,12 +118,16 @@ class Uri(Pathname):
         "_normalized_path",
     )
 
+    _ALL_SLOTS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ALL_SLOTS = _all_slots(cls)
+        cls._preinit = _make_preinit(cls._ALL_SLOTS)
+
     def __new__(cls, *uris, **options):
         inst = object.__new__(cls)
-        for cls in cls.__mro__:
-            for slot in getattr(cls, "__slots__", ()):
-                if not hasattr(inst, slot):
-                    setattr(inst, slot, None)
+        inst._preinit()
         return inst
 
     def __init__(self, *uris: UriLike, **options):
@@ -88,18 +173,7 @@ class Uri(Pathname):
 
     @classmethod
     def _parse_uri(cls, uri: str) -> tuple[Source, str, Query, str]:
-        parsed = uritools.urisplit(uri)
-        return (
-            Source(
-                parsed.getscheme(),
-                parsed.getuserinfo(),
-                parsed.gethost() or "",
-                parsed.getport(),
-            ),
-            parsed.getpath(),
-            Query(parsed.getquery() or ""),
-            parsed.getfragment() or "",
-        )
+        return _parse_uri(uri)
 
     @property
     def parts(self):
@@ -125,17 +199,20 @@ class Uri(Pathname):
                     source = src
                 paths.append(path)
 
-            for path in reversed(paths):
-                if not path:
-                    continue
-                if path.endswith("/"):
-                    _path = f"{path}{_path}"
-                elif _path:
-                    _path = f"{path}/{_path}"
-                else:
-                    _path = path
-                if _path.startswith("/"):
+            paths = [path for path in paths if path]
+            start = 0
+            for idx in range(len(paths) - 1, -1, -1):
+                if paths[idx].startswith("/"):
+                    start = idx
                     break
+            joined: list[str] = []
+            for path in paths[start:-1]:
+                joined.append(path)
+                if not path.endswith("/"):
+                    joined.append("/")
+            if paths:
+                joined.append(paths[-1])
+            _path = "".join(joined)
 
         if (
             (source.host or source.userinfo or source.port)
@@ -174,22 +251,7 @@ class Uri(Pathname):
         /,
         sanitize=True,
     ) -> str:
-        parts = {
-            "path": path,
-        }
-        if query:
-            parts["query"] = query
-        if fragment:
-            parts["fragment"] = fragment
-        if source:
-            source_ = source._asdict()
-            if sanitize:
-                source_["userinfo"] = (source_["userinfo"] or "").split(
-                    ":", maxsplit=1
-                )[0]
-            parts.update(source_)
-
-        return uritools.uricompose(**{k: v for k, v in parts.items() if v})
+        return _format_parsed_parts(source, path, query, fragment, sanitize)
 
     def __str__(self):
         """Return the string representation of the path, suitable for
@@ -341,9 +403,15 @@ class Uri(Pathname):
         return self.source.is_local()
 
     def __eq__(self, other: Pathname | str):
+        if other is self:
+            return True
         uri = other.as_uri() if isinstance(other, Pathname) else other
         return self.as_uri() == uri
 
+    def __hash__(self):
+        # Same key as __eq__, the composed uri is cached and str caches its hash
+        return hash(self.as_uri())
+
     def as_posix(self):
         source = self.source
         host = None
@@ -358,11 +426,22 @@ class Uri(Pathname):
         return posix
 
 
+Uri._ALL_SLOTS = _all_slots(Uri)
+Uri._preinit = _make_preinit(Uri._ALL_SLOTS)
+
+
 class UriPath(Uri, Path):
-    __slots__ = ("_backend",)
+    __slots__ = ("_backend", "_isdir")
     __SCHEMES: _ty.Sequence[str] = ()
     __SCHEMESMAP: _ty.Mapping[str, type["Self"]] = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The schemes maps of the ancestors are stale once a new class registers
+        for base in cls.__mro__[1:]:
+            if isinstance(base, type) and issubclass(base, UriPath):
+                setattr(base, f"_{base.__name__}__SCHEMESMAP", None)
+
     @classmethod
     def _schemesmap(cls, reload=False) -> _ty.Mapping[str, type["Self"]]:
         _propname = f"_{cls.__name__}__SCHEMESMAP"
@@ -474,9 +553,22 @@ class UriPath(Uri, Path):
         inst = super()._make_child_relpath(name, backend=self.backend, **kwargs)
         return inst
 
+    def _scandir(self) -> "_ty.Iterator[tuple[str, bool | None]]":
+        """
+        Yield (name, is_dir) for the directory contents,
+        is_dir is None when it is not known without another request
+        """
+        for name in self._listdir():
+            yield name, None
+
     def iterdir(self) -> "_ty.Iterator[Self]":
-        for path in self._listdir():
-            yield self._make_child_relpath(path)
+        for name, isdir in self._scandir():
+            inst = self._make_child_relpath(name)
+            inst._isdir = isdir
+            yield inst
+
+    def _is_dir_hint(self):
+        return self._isdir
 
 
 _ROOT = Uri("/")
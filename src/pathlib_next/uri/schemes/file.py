@@ -33,6 +33,15 @@ class FileUri(UriPath):
     def _listdir(self):
         yield from _os.listdir(self.filepath)
 
+    def _scandir(self):
+        # d_type from scandir gives the type for free, symlinks still need a stat
+        with _os.scandir(self.filepath) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    yield entry.name, None
+                else:
+                    yield entry.name, entry.is_dir(follow_symlinks=False)
+
     def stat(self, *, follow_symlinks=True):
         return self.filepath.stat(follow_symlinks=follow_symlinks)
 
@@ -1,17 +1,43 @@
+import collections as _collections
+import functools as _functools
 import io as _io
+import itertools as _itertools
+import os as _os
 import time as _time
 import typing as _ty
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 
 import bs4 as _bs4
 import requests as _req
 from htmllistparse import parse as _htmlparse
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+from requests.models import REDIRECT_STATI as _REDIRECT_STATI
+from requests.utils import get_environ_proxies as _get_environ_proxies
+from requests.utils import get_netrc_auth as _get_netrc_auth
+from urllib3.exceptions import HTTPError as _Urllib3HTTPError
+from urllib3.util import parse_url as _parse_url
+from urllib3.util.retry import Retry as _Retry
+
+try:
+    import lxml as _lxml
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html5lib"
 
 if _ty.TYPE_CHECKING:
     from urllib3.response import HTTPResponse
 
 from ... import utils as _utils
 from ...utils.stat import FileStat
-from .. import UriPath
+from .. import Source, UriPath
+
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+MAX_RETRIES = 3
+COPY_CONNECTIONS = 4
+COPY_CHUNK_SIZE = 8 << 20
+_CA_BUNDLE_ENVIRON = ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE")
 
 
 class _FileEntry(_ty.NamedTuple):
@@ -21,45 +47,187 @@ class _FileEntry(_ty.NamedTuple):
     description: _ty.Optional[str]
 
 
+def _create_session(source: Source):
+    session = _req.Session()
+    adapter = _HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_Retry(total=MAX_RETRIES, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_CACHED_SESSIONS = _utils.LRU(_create_session, maxsize=128)
+
+
+@_functools.lru_cache(maxsize=128)
+def _environ_configured(source: Source):
+    """Whether requests would pick proxies or netrc credentials for this source"""
+    url = str(source)
+    return bool(_get_environ_proxies(url) or _get_netrc_auth(url))
+
+
+class _HeadResponse(object):
+    """The parts of requests.Response that stat() reads, from a bare urllib3 HEAD"""
+
+    __slots__ = ("status_code", "headers", "url")
+
+    def __init__(self, status_code: int, headers, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+
+    @property
+    def is_redirect(self):
+        return "location" in self.headers and self.status_code in _REDIRECT_STATI
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise _req.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+    def close(self):
+        pass
+
+
+class _RangeNotHonored(OSError):
+    """A ranged GET was answered with something else than the requested bytes"""
+
+
 class HttpBackend(_ty.NamedTuple):
-    session: _req.Session
+    session: _req.Session | None
     requests_args: dict
 
+    def get_session(self, source: Source):
+        """Explicit session if one was given, else the pooled one for source"""
+        if self.session is not None:
+            return self.session
+        return _CACHED_SESSIONS(source)
+
     def request(self, method, uri: "HttpPath|str", **kwargs):
-        return self.session.request(
-            **self.requests_args,
-            **kwargs,
-            method=method,
-            url=uri if isinstance(uri, str) else uri.as_uri(False),
+        if isinstance(uri, str):
+            source = Source.from_str(uri, strict=False)
+        else:
+            source, uri = uri.source, uri.as_uri(False)
+        args = {**self.requests_args, **kwargs}
+        if "headers" in self.requests_args and "headers" in kwargs:
+            args["headers"] = {**self.requests_args["headers"], **kwargs["headers"]}
+        return self.get_session(source).request(**args, method=method, url=uri)
+
+    def head(self, uri: "HttpPath", headers: dict = None):
+        """
+        HEAD without following redirects. For pooled sessions with no extra
+        requests arguments, credentials or cookies it goes straight to the
+        session's urllib3 pool, skipping the request preparation and hooks of requests.
+        """
+        source = uri.source
+        session = None if self.session is not None else _CACHED_SESSIONS(source)
+        if (
+            session is None
+            or self.requests_args
+            or source.userinfo
+            or session.cookies
+            or _environ_configured(source)
+        ):
+            return self.request(
+                "HEAD", uri, allow_redirects=False, headers=headers or {}
+            )
+        url = uri.as_uri(False)
+        adapter: _HTTPAdapter = session.get_adapter(url)
+        # Same CA bundle and TLS settings as Session.send/HTTPAdapter.send
+        verify = session.verify
+        if verify is True and session.trust_env:
+            verify = next(
+                filter(None, map(_os.environ.get, _CA_BUNDLE_ENVIRON)), verify
+            )
+        # Build the pool key like HTTPAdapter.send so HEADs and GETs share a pool
+        prepared = _req.PreparedRequest()
+        prepared.url = url
+        host_params, pool_kwargs = adapter.build_connection_pool_key_attributes(
+            prepared, verify, session.cert
+        )
+        conn = adapter.poolmanager.connection_from_host(
+            **host_params, pool_kwargs=pool_kwargs
         )
+        adapter.cert_verify(conn, url, verify, session.cert)
+        try:
+            resp = conn.urlopen(
+                "HEAD",
+                _parse_url(url).request_uri,
+                headers={**session.headers, **(headers or {})},
+                redirect=False,
+                assert_same_host=False,
+                retries=adapter.max_retries,
+            )
+        except (_Urllib3HTTPError, OSError):
+            # Let requests retry it and raise its own (OSError based) exceptions
+            return self.request(
+                "HEAD", uri, allow_redirects=False, headers=headers or {}
+            )
+        return _HeadResponse(resp.status, resp.headers, url)
 
 
 class HttpPath(UriPath):
     __SCHEMES = ("http", "https")
-    __slots__ = ("_isdir", "_session", "_requests_args")
-    _isdir: bool
+    __slots__ = ("_stat", "_etag", "_lastmodified")
 
     if _ty.TYPE_CHECKING:
         backend: HttpBackend
 
     def _initbackend(self):
-        return HttpBackend(_req.Session(), {})
+        return HttpBackend(None, {})
 
     def _listdir(self) -> list[_FileEntry]:
-        req = self.backend.request("GET", self)
-        req.raise_for_status()
-        soup = _bs4.BeautifulSoup(req.content, "html5lib")
+        # bs4 still reads the whole page before parsing, streaming only lets the
+        # response be closed and its connection reused as soon as it is read
+        with self.backend.request("GET", self, stream=True) as req:
+            req.raise_for_status()
+            req.raw.decode_content = True
+            soup = _bs4.BeautifulSoup(req.raw, _HTML_PARSER)
         _, listing = _htmlparse(soup)
         return listing
 
-    def iterdir(self):
-        _self = self.path.removesuffix("/")
+    def _make_child_relpath(self, name: str, **kwargs):
         cls = type(self)
-        for path in self._listdir():
-            inst = type(self).__new__(cls, backend=self.backend)
-            inst._init(self.source, f"{_self}/{path.name}", "", "")
+        inst = cls.__new__(cls)
+        inst._init(
+            self.source,
+            f"{self.path.removesuffix('/')}/{name}",
+            "",
+            "",
+            backend=self.backend,
+            **kwargs,
+        )
+        return inst
+
+    def iterdir(self):
+        for entry in self._listdir():
+            inst = self._make_child_relpath(entry.name)
+            # Listing sizes and times are rounded, only the trailing slash is kept
+            inst._isdir = entry.name.endswith("/")
             yield inst
 
+    def iterdir_stats(
+        self, max_workers=16, *, follow_symlinks=True
+    ) -> "_ty.Iterator[tuple[HttpPath, FileStat | None]]":
+        """Yield (child, stat) pairs, issuing the HEAD requests concurrently.
+        The stat is None for children that no longer exist.
+        max_workers is capped to POOL_MAXSIZE so every worker keeps its connection alive.
+        """
+        children = list(self.iterdir())
+        if not children:
+            return
+        workers = max(1, min(max_workers, POOL_MAXSIZE, len(children)))
+        with _ThreadPoolExecutor(workers) as executor:
+            yield from zip(
+                children,
+                executor.map(
+                    lambda p: FileStat.from_path(p, follow_symlink=follow_symlinks),
+                    children,
+                ),
+            )
+
     def _is_dir(self, resp: _req.Response):
         return (
             resp.is_redirect
@@ -68,23 +236,53 @@ class HttpPath(UriPath):
             or resp.url.endswith("/.")
         )
 
-    def stat(self, *, follow_symlinks=True, walk_up_last_modified=False):
+    def invalidate(self):
+        """Forget the cached stat so the next stat() issues a plain HEAD"""
+        self._isdir = None
+        self._stat = None
+        self._etag = None
+        self._lastmodified = None
+
+    def stat(self, *, follow_symlinks=True, walk_up_last_modified=False, refresh=False):
+        """Stat through a HEAD request, the result is cached on the instance.
+        With refresh the cached result is revalidated with If-None-Match/If-Modified-Since
+        and reused when the server answers 304 Not Modified.
+        """
+        cached = self._stat
+        if walk_up_last_modified and cached is not None and not cached.st_mtime:
+            # Cached without a Last-Modified, stat again to walk up for one
+            cached = None
+        if cached is not None and not refresh:
+            return cached
+        headers = {}
+        if cached is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._lastmodified:
+                headers["If-Modified-Since"] = self._lastmodified
         check = (
             [self.with_path(self.path.removesuffix("/")), self]
             if self.path.endswith("/")
             else [self]
         )
         for uri in check:
-            resp = self.backend.request("HEAD", uri, allow_redirects=False)
+            resp = self.backend.head(uri, headers)
             resp.close()
             if resp.status_code < 400:
                 break
 
+        if resp.status_code == 304:
+            return self._stat
+
         if self._isdir is None:
             self._isdir = self._is_dir(resp)
 
         if resp.is_redirect:
-            resp = self.backend.request("HEAD", uri)
+            resp = self.backend.request("HEAD", uri, headers=headers)
+            if resp.status_code == 304:
+                return self._stat
+        if resp.status_code >= 400:
+            self._stat = self._etag = self._lastmodified = None
         if resp.status_code == 404:
             raise FileNotFoundError(self)
         elif resp.status_code == 403:
@@ -92,6 +290,8 @@ class HttpPath(UriPath):
         else:
             resp.raise_for_status()
 
+        self._etag = resp.headers.get("ETag")
+        self._lastmodified = resp.headers.get("Last-Modified")
         st_size = 0 if self._isdir else int(resp.headers.get("Content-Length", 0))
         lm = resp.headers.get("Last-Modified")
         if lm is None and walk_up_last_modified:
@@ -109,9 +309,13 @@ class HttpPath(UriPath):
                 except:
                     pass
 
-        return FileStat(
-            st_size=st_size, st_mtime=_utils.parsedate(lm), is_dir=self._isdir
+        self._stat = FileStat(
+            st_size=st_size,
+            # FileStat's default of 0 marks an unknown mtime
+            st_mtime=0 if lm is None else _utils.parsedate(lm),
+            is_dir=self._isdir,
         )
+        return self._stat
 
     def _open(
         self,
@@ -121,15 +325,93 @@ class HttpPath(UriPath):
         if mode != "r":
             raise NotImplementedError(mode)
         buffer_size = _io.DEFAULT_BUFFER_SIZE if buffering < 0 else buffering
-        req = self.backend.request("GET", self.as_uri(), stream=True)
+        req = self.backend.request("GET", self, stream=True)
         resp: "HTTPResponse" = req.raw
         resp.auto_close = False
+        # Let urllib3 undo Content-Encoding (gzip, deflate, ...) while reading
+        resp.decode_content = True
         return (
             resp
             if buffer_size == 0
             else _io.BufferedReader(resp, buffer_size=buffer_size)
         )
 
+    def _copy_to(
+        self,
+        target,
+        *,
+        hash_algo=None,
+        connections=COPY_CONNECTIONS,
+        chunk_size=COPY_CHUNK_SIZE,
+    ):
+        """
+        Download with parallel range requests when the server supports them,
+        chunks are written to target in order so it does not need to be seekable.
+        At most 2 * connections chunks are held in memory. If a range request is
+        not honored (the file changed or the server ignores Range) the download
+        restarts as a single stream.
+        """
+        identity = {"Accept-Encoding": "identity"}
+        resp = self.backend.request("HEAD", self, headers=identity)
+        resp.close()
+        size = int(resp.headers.get("Content-Length") or 0)
+        if (
+            connections < 2
+            or size <= chunk_size
+            or resp.status_code != 200
+            or resp.headers.get("Accept-Ranges", "").lower() != "bytes"
+        ):
+            return super()._copy_to(target, hash_algo=hash_algo)
+
+        etag = resp.headers.get("ETag")
+        if etag:
+            identity["If-Range"] = etag
+
+        def fetch(start: int):
+            end = min(start + chunk_size, size) - 1
+            headers = {**identity, "Range": f"bytes={start}-{end}"}
+            with self.backend.request(
+                "GET", self, stream=True, headers=headers
+            ) as resp:
+                resp.raise_for_status()
+                # Check before reading so a full 200 body is never downloaded
+                if resp.status_code != 206:
+                    raise _RangeNotHonored(self)
+                content = resp.content
+            if len(content) != end - start + 1:
+                raise _RangeNotHonored(self)
+            return content
+
+        hasher = None if hash_algo is None else _utils.hasher(hash_algo)
+        starts = iter(range(0, size, chunk_size))
+        executor = _ThreadPoolExecutor(connections)
+        try:
+            with target.open("wb") as output:
+                pending = _collections.deque(
+                    executor.submit(fetch, start)
+                    for start in _itertools.islice(starts, 2 * connections)
+                )
+                while pending:
+                    content = pending.popleft().result()
+                    for start in _itertools.islice(starts, 1):
+                        pending.append(executor.submit(fetch, start))
+                    if hasher is not None:
+                        hasher.update(content)
+                    output.write(content)
+        except _RangeNotHonored:
+            pass
+        else:
+            return None if hasher is None else hasher.hexdigest()
+        finally:
+            executor.shutdown(cancel_futures=True)
+        # Rewrites the partial target from the start
+        return super()._copy_to(target, hash_algo=hash_algo)
+
+    def read_bytes(self) -> bytes:
+        # urllib3 already buffers the socket, a BufferedReader would only add a copy
+        with self.open("rb", buffering=0) as f:
+            return f.read()
+
     def is_dir(self):
         if self._isdir is None:
             self.stat()
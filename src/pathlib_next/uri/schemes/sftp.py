@@ -1,3 +1,4 @@
+import stat as _stat
 import threading as _thread
 import typing as _ty
 
@@ -59,7 +60,7 @@ _CACHED_CLIENTS = _utils.LRU(_create_sftpclient, maxsize=128)
 class SftpPath(UriPath):
 
     __SCHEMES = ("sftp",)
-    __slots__ = ()
+    __slots__ = ("_lstat",)
 
     if _ty.TYPE_CHECKING:
         backend: BaseSftpBackend
@@ -79,28 +80,46 @@ class SftpPath(UriPath):
         for path in self._sftpclient.listdir(self.path):
             yield path
 
+    def iterdir(self):
+        for attr in self._sftpclient.listdir_attr(self.path):
+            inst = self._make_child_relpath(attr.filename)
+            inst._lstat = attr
+            yield inst
+
     def stat(self, *, follow_symlinks=True):
+        # listdir_attr results are lstat()s, only valid if following a symlink is not needed
+        lstat = self._lstat
+        if lstat is not None and lstat.st_mode is not None:
+            if not follow_symlinks or not _stat.S_ISLNK(lstat.st_mode):
+                return lstat
         if follow_symlinks:
             return self._sftpclient.stat(self.path)
         else:
             return self._sftpclient.lstat(self.path)
 
     def _open(self, mode="r", buffering=-1):
+        if mode != "r":
+            self._lstat = None
         return self._sftpclient.open(self.path, mode, buffering)
 
     def _mkdir(self, mode):
+        self._lstat = None
         return self._sftpclient.mkdir(self.path, mode)
 
     def chmod(self, mode):
+        self._lstat = None
         return self._sftpclient.chmod(self.path, mode)
 
     def unlink(self, missing_ok=False):
         if missing_ok and not self.exists():
             return
+        self._lstat = None
         return self._sftpclient.remove(self.path)
 
     def rmdir(self):
+        self._lstat = None
         return self._sftpclient.rmdir(self.path)
 
     def _rename(self, target):
+        self._lstat = None
         return self._sftpclient.rename(self.path, target.as_posix())
@@ -1,5 +1,6 @@
 import collections
 import functools as _functools
+import hashlib as _hashlib
 import time as _time
 import typing as _ty
 from email.utils import parsedate as _parsedate
@@ -27,7 +28,7 @@ class LRU(_ty.Generic[K, V]):
         with self.lock:
             self._maxsize = maxsize
             while len(cache) > maxsize:
-                cache.pop(last=False)
+                cache.popitem(last=False)
 
     def __call__(self, *args: K.args) -> V:
         cache = self.cache
@@ -69,6 +70,11 @@ def sizeof_fmt(num: _ty.Union[int, float]):
     return "%.1f%s" % (num, "Y")
 
 
+def hasher(algo: "str | _ty.Callable[[], _hashlib._Hash]"):
+    """New hash object from a hashlib algorithm name or a hash constructor"""
+    return _hashlib.new(algo) if isinstance(algo, str) else algo()
+
+
 def notimplemented(method):
     @_functools.wraps(method)
     def _notimplemented(*args, **kwargs):
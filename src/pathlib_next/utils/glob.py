@@ -47,10 +47,11 @@ def glob(
     if case_sensitive is None:
         case_sensitive = path._is_case_sensitive
 
+    name = path.name
     include_hidden = include_hidden or path.is_hidden()
-    pattern = compile_pattern(path.name, case_sensitive) if path.name else ANY_PATTERN
+    pattern = compile_pattern(name, case_sensitive) if name else ANY_PATTERN
 
-    name_is_pattern = WILCARD_PATTERN.match(path.name) != None
+    name_is_pattern = WILCARD_PATTERN.match(name) != None
     wildcard_in_path = name_is_pattern or path.has_glob_pattern()
     parent = next(iter(path.parents), None)
 
@@ -58,7 +59,7 @@ def glob(
         (root_dir or parent) if not root_dir or not parent else (root_dir / parent)
     )
 
-    if recursive and path.name == RECURSIVE:
+    if recursive and name == RECURSIVE:
         globber = _glob_recursive
     else:
         globber = _glob_with_pattern
@@ -91,18 +92,12 @@ def glob(
 def _glob_with_pattern(
     parent: _Globable, pattern: _re.Pattern, dironly: bool, include_hidden=False
 ) -> _ty.Iterable[_Globable]:
-    if not include_hidden:
-
-        def _filter(p: _Globable):
-            return not p.is_hidden()
-
-    else:
-
-        def _filter(p: _Globable):
-            return True
-
+    # The compiled pattern is the cheapest check, run it before is_hidden()
+    match = None if pattern is ANY_PATTERN else pattern.match
     for path in _iterdir(parent, dironly):
-        if _filter(path) and pattern.match(path.name):
+        if match is not None and match(path.name) is None:
+            continue
+        if include_hidden or not path.is_hidden():
             yield path
 
 
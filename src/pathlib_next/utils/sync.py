@@ -1,6 +1,12 @@
+import asyncio as _asyncio
 import enum as _enum
+import os as _os
+import sqlite3 as _sqlite3
+import threading as _threading
 import typing as _ty
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 
+from .. import utils as _utils
 from ..path import Path
 from ..utils.stat import FileStat
 
@@ -58,6 +64,83 @@ if _ty.TYPE_CHECKING:
     class PathAndStat(PathAndStat, FileStat): ...
 
 
+class ChecksumCache(object):
+    """
+    Wraps a checksum function, storing its results in sqlite keyed on (path, size, mtime)
+    so files that did not change are not read again.
+    Paths without a known mtime (st_mtime of 0) are always checksummed and never stored.
+    Checksums must be int, str or bytes, which sqlite stores as is.
+    A cache file should only be used with one checksum function.
+    """
+
+    __slots__ = ("checksum", "_db", "_memory", "_lock")
+
+    def __init__(
+        self,
+        checksum: _ty.Callable[[PathAndStat], int | str | bytes],
+        path: str | _os.PathLike = ":memory:",
+        /,
+        maxsize: int = 4096,
+    ) -> None:
+        self.checksum = checksum
+        self._memory = _utils.LRU(self._select, maxsize)
+        self._lock = _threading.RLock()
+        self._db = _sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "path TEXT, size INTEGER, mtime REAL, checksum BLOB, "
+            "PRIMARY KEY (path, size, mtime))"
+        )
+
+    @property
+    def maxsize(self):
+        return self._memory.maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int):
+        self._memory.maxsize = maxsize
+
+    def _select(self, *key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT checksum FROM digests WHERE path=? AND size=? AND mtime=?",
+                key,
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def __call__(self, path: PathAndStat):
+        stat = path.stat
+        if stat is None or not stat.st_mtime:
+            return self.checksum(path)
+        key = (str(path), stat.st_size, stat.st_mtime)
+        value = self._memory(*key)
+        if value is not None:
+            return value
+
+        value = self.checksum(path)
+        if not isinstance(value, (int, str, bytes)):
+            raise TypeError(
+                f"checksum must be int, str or bytes, not {type(value).__name__}"
+            )
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?)", (*key, value)
+            )
+        with self._memory.lock:
+            self._memory.cache[key] = value
+        return value
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class _OnPathSyncerError(_ty.Protocol):
     def __call__(
         self,
@@ -86,7 +169,10 @@ class PathSyncer(object):
         follow_symlinks: bool = True,
         hook: _ty.Callable[[PathAndStat, PathAndStat, SyncEvent, bool], None] = None,
         ignore_error: _OnPathSyncerError | bool = False,
+        cache_path: str | _os.PathLike = None,
     ) -> None:
+        if cache_path is not None:
+            checksum = ChecksumCache(checksum, cache_path)
         self.checksum = checksum
         self.remove_missing = remove_missing
         self._hook = hook
@@ -97,6 +183,17 @@ class PathSyncer(object):
             _ignore_error = ignore_error
         self.ignore_error = _ty.cast(_OnPathSyncerError, _ignore_error)
 
+    def close(self):
+        """Close the checksum cache opened for cache_path, if any"""
+        if isinstance(self.checksum, ChecksumCache):
+            self.checksum.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def log(self, msg: str, **kwargs: str):
         print(msg.format_map(kwargs))
 
@@ -134,6 +231,66 @@ class PathSyncer(object):
         ignore_error: (
             bool | _ty.Callable[[Exception, PathAndStat, PathAndStat], None]
         ) = False,
+    ):
+        self._sync(
+            source,
+            target,
+            dry_run,
+            ignore_error,
+            lambda _source, _target, *child: self.sync(*child),
+        )
+
+    async def sync_async(
+        self,
+        source: Path | PathAndStat,
+        target: Path | PathAndStat,
+        /,
+        dry_run: bool = False,
+        ignore_error: (
+            bool | _ty.Callable[[Exception, PathAndStat, PathAndStat], None]
+        ) = False,
+        concurrency: int = 16,
+    ):
+        """
+        Like sync() but the children of a directory are synced concurrently,
+        the blocking stat/checksum/copy work of each path runs on a pool of
+        concurrency threads. A directory's SyncChild and Synced events may fire
+        before its children are done.
+        """
+        loop = _asyncio.get_running_loop()
+
+        with _ThreadPoolExecutor(concurrency) as executor:
+
+            async def sync_path(source, target, dry_run, ignore_error=False):
+                children: list[tuple] = []
+                await loop.run_in_executor(
+                    executor,
+                    self._sync,
+                    source,
+                    target,
+                    dry_run,
+                    ignore_error,
+                    lambda *args: children.append(args),
+                )
+                await _asyncio.gather(*(sync_child(*args) for args in children))
+
+            async def sync_child(source, target, child, child_target, dry_run):
+                # Errors are handled as by the SyncChild hook in sync()
+                try:
+                    await sync_path(child, child_target, dry_run)
+                except Exception as e:
+                    if not self.ignore_error(e, source, target, SyncEvent.SyncChild):
+                        raise
+
+            await sync_path(source, target, dry_run, ignore_error)
+
+    def _sync(
+        self,
+        source: Path | PathAndStat,
+        target: Path | PathAndStat,
+        dry_run: bool,
+        ignore_error: bool | _ty.Callable[[Exception, PathAndStat, PathAndStat], None],
+        sync_child: _ty.Callable[[PathAndStat, PathAndStat, Path, Path, bool], None],
     ):
         checksum = self.checksum
 
@@ -246,7 +403,9 @@ class PathSyncer(object):
                         target,
                         SyncEvent.SyncChild,
                         False,
-                        lambda: self.sync(
+                        lambda: sync_child(
+                            source,
+                            target,
                             child,
                             target.path / (child.name or child.parent.name),
                             dry_run,
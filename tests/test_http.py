@@ -0,0 +1,213 @@
+import base64
+import hashlib
+import http.server
+import socket
+import threading
+
+import pytest
+
+import src.pathlib_next as pathlib_next
+
+LAST_MODIFIED = "Wed, 01 Jan 2020 10:00:00 GMT"
+LISTING = """<html><head><title>Index of /</title></head><body><h1>Index of /</h1>
+<pre><a href="?C=N;O=D">Name</a>  <a href="?C=M;O=A">Last modified</a>  <a href="?C=S;O=A">Size</a><hr>
+<a href="file.txt">file.txt</a>    2020-01-01 10:00  4.9K
+<a href="sub/">sub/</a>        2020-01-01 10:00    -
+</pre><hr></body></html>"""
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def _send(self, status: int, headers: dict, body=b"", head=False):
+        self.send_response(status)
+        for key, value in {**headers, "Content-Length": str(len(body))}.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _respond(self, head: bool):
+        server = self.server
+        server.requests.append((self.command, self.path, dict(self.headers)))
+        if server.auth is not None:
+            expected = "Basic " + base64.b64encode(server.auth.encode()).decode()
+            if self.headers.get("Authorization") != expected:
+                return self._send(401, {"WWW-Authenticate": 'Basic realm="test"'})
+
+        content = server.files.get(self.path)
+        if content is None:
+            return self._send(404, {}, head=head)
+        etag = '"%s"' % hashlib.sha256(content).hexdigest()
+        headers = {
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+        }
+        if server.last_modified:
+            headers["Last-Modified"] = server.last_modified
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers, head=True)
+
+        status, body = 200, content
+        range_ = self.headers.get("Range")
+        if range_ and server.ranges and self.headers.get("If-Range", etag) == etag:
+            start, end = map(int, range_.removeprefix("bytes=").split("-"))
+            status, body = 206, content[start : end + 1]
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+        self._send(status, headers, body, head=head)
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files: dict[str, bytes] = {
+            "/": LISTING.encode(),
+            "/file.txt": b"x" * 5000,
+            "/sub/": b"",
+        }
+        self.auth: str | None = None
+        self.last_modified: str | None = LAST_MODIFIED
+        self.ranges = True
+        self.requests: list[tuple[str, str, dict]] = []
+
+    def url(self, path: str = "/", userinfo: str = ""):
+        host, port = self.server_address
+        userinfo = f"{userinfo}@" if userinfo else ""
+        return f"http://{userinfo}{host}:{port}{path}"
+
+    def count(self, method: str):
+        return sum(1 for request in self.requests if request[0] == method)
+
+
+@pytest.fixture
+def server():
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_stat_cache(server: _Server):
+    path = pathlib_next.UriPath(server.url("/file.txt"))
+    stat = path.stat()
+    assert stat.st_size == 5000
+    assert path.stat() is stat
+    assert server.count("HEAD") == 1
+
+    # Revalidated with the ETag and reused on 304
+    assert path.stat(refresh=True) is stat
+    assert server.count("HEAD") == 2
+    assert server.requests[-1][2]["If-None-Match"] == path._etag
+
+    server.files["/file.txt"] = b"changed"
+    stat = path.stat(refresh=True)
+    assert stat.st_size == 7
+
+    path.invalidate()
+    assert path.stat() is not stat
+    assert "If-None-Match" not in server.requests[-1][2]
+
+    del server.files["/file.txt"]
+    with pytest.raises(FileNotFoundError):
+        path.stat(refresh=True)
+    assert path._stat is None
+
+
+def test_iterdir_stat(server: _Server):
+    root = pathlib_next.UriPath(server.url())
+    children = {child.name or child.parent.name: child for child in root.iterdir()}
+    assert children["sub"].is_dir()
+    assert not children["file.txt"].is_dir()
+    assert server.count("HEAD") == 0
+
+    # The listing rounds the size to 4.9K, stat() asks the server
+    assert children["file.txt"].stat().st_size == 5000
+    assert server.count("HEAD") == 1
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_copy_ranges(server: _Server, tmp_path, ranges: bool):
+    content = bytes(range(256)) * 40
+    server.files["/big.bin"] = content
+    server.ranges = ranges
+    target = pathlib_next.LocalPath(tmp_path / "big.bin")
+
+    path = pathlib_next.UriPath(server.url("/big.bin"))
+    digest = path._copy_to(target, hash_algo="sha256", connections=2, chunk_size=1000)
+    assert target.read_bytes() == content
+    assert digest == hashlib.sha256(content).hexdigest()
+    ranged = [request for request in server.requests if "Range" in request[2]]
+    if ranges:
+        assert len(ranged) == 11
+    else:
+        # Ignored ranges fall back to one plain GET
+        assert ranged and server.requests[-1][0] == "GET"
+        assert "Range" not in server.requests[-1][2]
+
+
+def test_stat_credentials(server: _Server):
+    server.auth = "user:secret"
+    root = pathlib_next.UriPath(server.url(userinfo="user:secret"))
+    assert (root / "file.txt").stat().st_size == 5000
+    for child in root.iterdir():
+        assert child.stat() is not None
+    assert (root / "file.txt").read_bytes() == b"x" * 5000
+
+    with pytest.raises(Exception) as error:
+        pathlib_next.UriPath(server.url("/file.txt")).stat()
+    assert "401" in str(error.value)
+
+
+def test_stat_connection_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        host, port = sock.getsockname()
+    with pytest.raises(OSError):
+        pathlib_next.UriPath(f"http://{host}:{port}/file.txt").stat()
+
+
+def test_stat_shares_pool(server: _Server):
+    path = pathlib_next.UriPath(server.url("/file.txt"))
+    path.stat()
+    path.read_bytes()
+    adapter = path.backend.get_session(path.source).get_adapter(server.url())
+    assert len(adapter.poolmanager.pools) == 1
+
+
+def test_stat_walk_up_last_modified(server: _Server):
+    server.last_modified = None
+    path = pathlib_next.UriPath(server.url("/file.txt"))
+    assert path.stat().st_mtime == 0
+    # Taken from the parent listing, not the cached stat without an mtime
+    assert path.stat(walk_up_last_modified=True).st_mtime
+    assert path.stat().st_mtime
+
+
+def test_iterdir_stats(server: _Server):
+    gone = '<a href="gone.txt">gone.txt</a>    2020-01-01 10:00  1.0K\n</pre>'
+    server.files["/"] = LISTING.replace("</pre>", gone).encode()
+    root = pathlib_next.UriPath(server.url())
+
+    stats = {
+        child.name or child.parent.name: stat
+        for child, stat in root.iterdir_stats(max_workers=4)
+    }
+    assert stats.keys() == {"file.txt", "sub", "gone.txt"}
+    assert stats["file.txt"].st_size == 5000
+    assert stats["sub"].is_dir()
+    assert stats["gone.txt"] is None
+    # One HEAD per child, plus the slashless try for the directory
+    assert server.count("HEAD") == 4
@@ -20,3 +20,33 @@ def test_local_fspath(pathname:str):
     local = pathlib_next.LocalPath(pathname)
     assert local.__fspath__() ==  os.fspath(os.path.normpath(pathname))
 
+
+def test_local_copy_hash(tmp_path):
+    import hashlib
+
+    source = pathlib_next.LocalPath(tmp_path / "source.bin")
+    source.write_bytes(b"content")
+    target = pathlib_next.LocalPath(tmp_path / "target.bin")
+    digest = source.copy(target, hash_algo="sha256")
+    assert digest == hashlib.sha256(b"content").hexdigest()
+    assert target.read_bytes() == b"content"
+
+
+def test_file_uri_walk(tmp_path):
+    (tmp_path / "dir" / "sub").mkdir(parents=True)
+    (tmp_path / "dir" / "file.txt").write_text("content")
+    root = pathlib_next.UriPath(tmp_path.as_uri()) / "dir"
+
+    walked = {
+        path.name: (sorted(dirnames), sorted(filenames))
+        for path, dirnames, filenames in root.walk()
+    }
+    assert walked == {"dir": (["sub"], ["file.txt"]), "sub": ([], [])}
+
+    children = {child.name: child for child in root.iterdir()}
+    children["sub"].rmdir()
+    children["sub"].touch()
+    assert not children["sub"].is_dir() and children["sub"].is_file()
+    children["file.txt"].unlink()
+    children["file.txt"].mkdir()
+    assert children["file.txt"].is_dir()
@@ -0,0 +1,74 @@
+import stat
+
+import paramiko
+
+from src.pathlib_next.uri.schemes.sftp import BaseSftpBackend, SftpPath
+
+
+def _attr(filename: str, mode: int, size=0):
+    attr = paramiko.SFTPAttributes()
+    attr.filename = filename
+    attr.st_mode = mode
+    attr.st_size = size
+    return attr
+
+
+class _Client(object):
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+        self.sock = type("sock", (), {"active": True})()
+        self.attrs = {
+            "/dir/file.txt": _attr("file.txt", stat.S_IFREG | 0o644, 7),
+            "/dir/link": _attr("link", stat.S_IFLNK | 0o777),
+        }
+
+    def listdir_attr(self, path: str):
+        self.calls.append(("listdir_attr", path))
+        return list(self.attrs.values())
+
+    def stat(self, path: str):
+        self.calls.append(("stat", path))
+        return _attr(path, stat.S_IFREG | 0o600, 7)
+
+    def lstat(self, path: str):
+        self.calls.append(("lstat", path))
+        return self.attrs[path]
+
+    def chmod(self, path: str, mode: int):
+        self.calls.append(("chmod", path))
+
+    def remove(self, path: str):
+        self.calls.append(("remove", path))
+
+
+class _Backend(BaseSftpBackend):
+    __slots__ = ("_client",)
+
+    def __init__(self, client: _Client):
+        self._client = client
+
+    def client(self, source):
+        return self._client
+
+
+def test_iterdir_stat_cache():
+    client = _Client()
+    root = SftpPath("sftp://host/dir", backend=_Backend(client))
+    children = {child.name: child for child in root.iterdir()}
+
+    # The listing attributes answer stat() without a round trip
+    assert children["file.txt"].stat().st_size == 7
+    assert children["link"].stat(follow_symlinks=False) is client.attrs["/dir/link"]
+    assert client.calls == [("listdir_attr", "/dir")]
+
+    # Symlinks are still followed through the server
+    assert stat.S_ISREG(children["link"].stat().st_mode)
+    assert client.calls[-1] == ("stat", "/dir/link")
+
+    # Mutations drop the listing attributes
+    children["file.txt"].chmod(0o600)
+    assert children["file.txt"].stat().st_mode == stat.S_IFREG | 0o600
+    assert client.calls[-2:] == [("chmod", "/dir/file.txt"), ("stat", "/dir/file.txt")]
+    children["link"].unlink()
+    children["link"].stat(follow_symlinks=False)
+    assert client.calls[-2:] == [("remove", "/dir/link"), ("lstat", "/dir/link")]
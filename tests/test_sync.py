@@ -0,0 +1,116 @@
+import asyncio
+import os
+import sqlite3
+
+import pytest
+
+import src.pathlib_next as pathlib_next
+from src.pathlib_next.utils.sync import ChecksumCache, PathAndStat, PathSyncer
+
+
+def test_checksum_cache(tmp_path):
+    calls = []
+
+    def checksum(path: PathAndStat):
+        calls.append(path)
+        return path.path.read_bytes()
+
+    file = pathlib_next.LocalPath(tmp_path / "file.txt")
+    file.write_text("content")
+    cache_path = tmp_path / "checksums.db"
+
+    cache = ChecksumCache(checksum, cache_path)
+    assert cache(PathAndStat(file)) == b"content"
+    assert cache(PathAndStat(file)) == b"content"
+    assert len(calls) == 1
+    cache.close()
+
+    cache = ChecksumCache(checksum, cache_path)
+    assert cache(PathAndStat(file)) == b"content"
+    assert len(calls) == 1
+    cache.close()
+
+
+def test_sync_async(tmp_path):
+    source = pathlib_next.LocalPath(tmp_path / "source")
+    (source / "a" / "b").mkdir(parents=True)
+    (source / "root.txt").write_text("root")
+    (source / "a" / "a.txt").write_text("a")
+    (source / "a" / "b" / "b.txt").write_text("b")
+    target = pathlib_next.LocalPath(tmp_path / "target")
+
+    asyncio.run(
+        PathSyncer(lambda p: p.path.read_bytes()).sync_async(
+            source, target, concurrency=4
+        )
+    )
+
+    assert (target / "root.txt").read_text() == "root"
+    assert (target / "a" / "a.txt").read_text() == "a"
+    assert (target / "a" / "b" / "b.txt").read_text() == "b"
+
+
+def test_checksum_cache_unknown_mtime(tmp_path):
+    calls = []
+
+    def checksum(path: PathAndStat):
+        calls.append(path)
+        return path.path.read_bytes()
+
+    file = pathlib_next.LocalPath(tmp_path / "file.txt")
+    file.write_text("content")
+    os.utime(file, (0, 0))
+
+    with PathSyncer(checksum, cache_path=tmp_path / "checksums.db") as syncer:
+        assert syncer.checksum(PathAndStat(file)) == b"content"
+        assert syncer.checksum(PathAndStat(file)) == b"content"
+    assert len(calls) == 2
+    file.touch()
+    with pytest.raises(sqlite3.ProgrammingError):
+        syncer.checksum(PathAndStat(file))
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_sync_ignore_child_error(tmp_path, use_async: bool):
+    def checksum(path: PathAndStat):
+        if path.path.name == "bad.txt":
+            raise OSError(path)
+        return path.path.read_bytes()
+
+    source = pathlib_next.LocalPath(tmp_path / "source")
+    (source / "dir").mkdir(parents=True)
+    (source / "dir" / "bad.txt").write_text("bad")
+    (source / "dir" / "good.txt").write_text("good")
+    target = pathlib_next.LocalPath(tmp_path / "target")
+    (target / "dir").mkdir(parents=True)
+    (target / "dir" / "bad.txt").write_text("old")
+
+    syncer = PathSyncer(checksum, ignore_error=True)
+    if use_async:
+        asyncio.run(syncer.sync_async(source, target))
+    else:
+        syncer.sync(source, target)
+    assert (target / "dir" / "good.txt").read_text() == "good"
+    assert (target / "dir" / "bad.txt").read_text() == "old"
+
+    with pytest.raises(OSError):
+        syncer = PathSyncer(checksum)
+        if use_async:
+            asyncio.run(syncer.sync_async(source, target))
+        else:
+            syncer.sync(source, target)
+
+
+def test_checksum_cache_types(tmp_path):
+    file = pathlib_next.LocalPath(tmp_path / "file.txt")
+    file.write_text("content")
+
+    with ChecksumCache(lambda path: 1 << 40, tmp_path / "int.db") as cache:
+        assert cache(PathAndStat(file)) == 1 << 40
+    with ChecksumCache(lambda path: None, tmp_path / "int.db") as cache:
+        assert cache(PathAndStat(file)) == 1 << 40
+        cache.maxsize = 0
+
+    with ChecksumCache(lambda path: {"size": 7}, tmp_path / "dict.db") as cache:
+        with pytest.raises(TypeError):
+            cache(PathAndStat(file))
@@ -97,3 +97,42 @@ def test_join_without_root():
     authkeys = Uri("sftp://root@sftpexample") / "root/.ssh/authorized_keys"
     uri = authkeys.as_uri()
     assert uri == "sftp://root@sftpexample/root/.ssh/authorized_keys"
+
+
+def test_parents_contains():
+    parents = Uri("http://google.com/root/subroot/filename.ext").parents
+    assert Uri("http://google.com/root") in parents
+    assert Uri("http://google.com/root/subroot") in parents
+    assert Uri("http://google.com/other") not in parents
+    assert Uri("http://example.com/root") not in parents
+    assert parents[0] is parents[0]
+    assert Uri("/a/") in Uri("/a//b").parents
+    assert Uri("http://h/") in Uri("http://h//a").parents
+
+
+def test_join_many_segments():
+    uri = Uri("http://google.com/root", "sub/", "dir", "file.ext")
+    assert uri.path == "/root/sub/dir/file.ext"
+    uri = Uri("http://google.com/root", "sub", "/abs", "file.ext")
+    assert uri.path == "/abs/file.ext"
+
+
+def test_hash():
+    uris = {
+        Uri("http://google.com/root/file.ext"),
+        Uri("http://google.com/root", "file.ext"),
+        Uri("http://google.com/root/other.ext"),
+    }
+    assert len(uris) == 2
+    assert Uri("http://google.com/root/file.ext") in uris
+    assert "http://google.com/root/file.ext" in uris
+
+
+def test_scheme_registration():
+    assert type(pathlib_next.UriPath("custom://host/path")) is pathlib_next.UriPath
+
+    class CustomPath(pathlib_next.UriPath):
+        __SCHEMES = ("custom",)
+        __slots__ = ()
+
+    assert type(pathlib_next.UriPath("custom://host/path")) is CustomPath